@@ -4,41 +4,144 @@ Performs sentiment analysis, NLP, trending analysis, and insights extraction.
 """
 
 import logging
-from typing import List, Dict, Tuple
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Iterable, List, Dict, Tuple, Union
 import pandas as pd
 import numpy as np
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-import spacy
 from collections import Counter
 from config import (
     SENTIMENT_THRESHOLD_POSITIVE,
     SENTIMENT_THRESHOLD_NEGATIVE,
     MIN_ENGAGEMENT_THRESHOLD,
     CSV_EXPORT_PATH,
+    PARQUET_EXPORT_PATH,
+    NLP_BATCH_SIZE,
+    NLP_N_PROCESS,
+    TOPIC_CACHE_SIZE,
 )
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Initialize NLP tools
-try:
-    nlp = spacy.load("en_core_web_sm")
-    logger.info("Loaded spaCy model")
-except OSError:
-    logger.warning("spaCy model not found. Install with: python -m spacy download en_core_web_sm")
-    nlp = None
+# Copy-on-Write lets the analyzer share column buffers with the caller's frame
+# (always on from pandas 3.0, where the option is deprecated)
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
 
-sentiment_analyzer = SentimentIntensityAnalyzer()
+
+# NLP tools are loaded on first use so importing this module (e.g. from the
+# Gradio app) doesn't pay the model load cost up front
+@lru_cache(maxsize=None)
+def _get_nlp():
+    """Return the shared spaCy pipeline, or None if the model isn't installed."""
+    import spacy
+
+    try:
+        # Only doc.ents and doc.noun_chunks are used; noun_chunks still needs the
+        # tagger, attribute_ruler (tag -> POS) and parser, so only lemmas are dropped
+        nlp = spacy.load("en_core_web_sm", exclude=["lemmatizer"])
+        logger.info("Loaded spaCy model")
+        return nlp
+    except OSError:
+        logger.warning("spaCy model not found. Install with: python -m spacy download en_core_web_sm")
+        return None
+
+
+@lru_cache(maxsize=None)
+def _get_sentiment_analyzer():
+    """Return the shared VADER sentiment analyzer."""
+    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+    return SentimentIntensityAnalyzer()
+
+
+TOPIC_ENTITY_LABELS = {"PRODUCT", "ORG", "PERSON"}
+
+# Per-text topics, kept across analyzer instances so repeat searches in the
+# web app don't re-run spaCy on titles it has already seen (LRU eviction)
+_topic_cache: "OrderedDict[str, Tuple[str, ...]]" = OrderedDict()
+_topic_cache_lock = threading.Lock()
+
+
+def _doc_topics(doc) -> Tuple[str, ...]:
+    """
+    Return the entities and noun phrases of a spaCy Doc, in document order.
+
+    Topics are lowercased and stripped so "AI" and "ai" count as one topic;
+    noun phrases of two characters or fewer ("it", "we") are dropped.
+    """
+    entities = (ent.text.lower().strip() for ent in doc.ents if ent.label_ in TOPIC_ENTITY_LABELS)
+    noun_phrases = (chunk.text.lower().strip() for chunk in doc.noun_chunks)
+    return (*entities, *(phrase for phrase in noun_phrases if len(phrase) > 2))
+
+
+def _topics_for_texts(texts: List[str]) -> List[Tuple[str, ...]]:
+    """Return topics for each text, running nlp.pipe only on uncached texts."""
+    unique_texts = list(dict.fromkeys(texts))
+    # Copy hits while locked: a concurrent call may evict them before we reinsert
+    with _topic_cache_lock:
+        topics_by_text = {text: _topic_cache[text] for text in unique_texts if text in _topic_cache}
+    misses = [text for text in unique_texts if text not in topics_by_text]
+
+    if misses:
+        docs = _get_nlp().pipe(misses, batch_size=NLP_BATCH_SIZE, n_process=NLP_N_PROCESS)
+        topics_by_text.update((text, _doc_topics(doc)) for text, doc in zip(misses, docs))
+
+    with _topic_cache_lock:
+        for text in unique_texts:
+            _topic_cache[text] = topics_by_text[text]
+            _topic_cache.move_to_end(text)
+        while len(_topic_cache) > TOPIC_CACHE_SIZE:
+            _topic_cache.popitem(last=False)
+
+    return [topics_by_text[text] for text in texts]
+
+
+def top_n_positions(values: np.ndarray, n: int) -> np.ndarray:
+    """
+    Return the positions of the n largest values, largest first.
+
+    Selection is O(len(values)) via np.partition and only the chosen n are
+    sorted. Ties keep their original order, as with DataFrame.nlargest(n, ...)
+    and keep="first". NaNs are dropped, unlike nlargest, which fills with NaN
+    rows when n exceeds the non-NaN count.
+
+    Args:
+        values: 1-D array of scores
+        n: Number of positions to return
+
+    Returns:
+        Integer array of positions into values
+    """
+    values = np.asarray(values, dtype=np.float64)
+    candidates = np.flatnonzero(~np.isnan(values))
+    k = max(0, min(n, len(candidates)))
+    if k == 0:
+        return candidates[:0]
+
+    selected = values[candidates]
+    kth = np.partition(selected, len(selected) - k)[len(selected) - k]
+    above = np.flatnonzero(selected > kth)
+    ties = np.flatnonzero(selected == kth)[: k - len(above)]
+    part = np.sort(np.concatenate([above, ties]))
+    return candidates[part[np.argsort(-selected[part], kind="stable")]]
 
 
 class YouTubeAnalyzer:
     """Analyzes YouTube video data for trends, sentiment, and insights."""
 
     def __init__(self, df: pd.DataFrame):
-        self.df = df.copy()
+        # assign() returns a new frame without deep-copying the large text columns;
+        # few channels repeat across many videos, so integer codes make groupby cheaper
+        self.df = df.assign(channel_title=df["channel_title"].astype("category"))
         self.insights = {}
 
+        # Text inputs shared by the sentiment and theme passes, built once
+        titles = self.df["title"].fillna("")
+        self._titles = titles.tolist()
+        self._title_descriptions = (titles + " " + self.df["description"].fillna("")).tolist()
+
     def analyze_sentiment(self) -> pd.DataFrame:
         """
         Perform sentiment analysis on video titles and descriptions.
@@ -48,45 +151,37 @@ class YouTubeAnalyzer:
         """
         logger.info("Performing sentiment analysis")
 
-        sentiments = []
-        for idx, row in self.df.iterrows():
-            text = f"{row['title']} {row['description']}"
-            scores = sentiment_analyzer.polarity_scores(text)
-            sentiments.append(
-                {
-                    "video_id": row["video_id"],
-                    "compound_sentiment": scores["compound"],
-                    "positive": scores["pos"],
-                    "negative": scores["neg"],
-                    "neutral": scores["neu"],
-                }
-            )
+        sentiment_analyzer = _get_sentiment_analyzer()
+        scores = [sentiment_analyzer.polarity_scores(text) for text in self._title_descriptions]
 
-        sentiment_df = pd.DataFrame(sentiments)
-        self.df = self.df.merge(sentiment_df, on="video_id")
+        # Assign all score columns in one pass instead of merging a second frame
+        self.df[["compound_sentiment", "positive", "negative", "neutral"]] = (
+            pd.DataFrame(scores, index=self.df.index, columns=["compound", "pos", "neg", "neu"])
+            .to_numpy(dtype=float)
+        )
         return self.df
 
-    def extract_key_topics(self, text: str, top_n: int = 5) -> List[str]:
+    def extract_key_topics(self, text: Union[str, Iterable[str]], top_n: int = 5) -> List[str]:
         """
         Extract key topics/entities from text using spaCy.
 
         Args:
-            text: Input text
+            text: Input text, or an iterable of texts to batch through nlp.pipe
             top_n: Number of top topics to return
 
         Returns:
             List of key topics
         """
-        if nlp is None:
+        if _get_nlp() is None:
             return []
 
-        doc = nlp(text)
-        entities = [ent.text for ent in doc.ents if ent.label_ in ["PRODUCT", "ORG", "PERSON"]]
-        noun_phrases = [chunk.text for chunk in doc.noun_chunks]
+        texts = [text] if isinstance(text, str) else list(text)
+
+        # Count entities and noun phrases across all docs
+        topic_counts = Counter()
+        for topics in _topics_for_texts(texts):
+            topic_counts.update(topics)
 
-        # Combine and get most common
-        all_topics = entities + noun_phrases
-        topic_counts = Counter(all_topics)
         return [topic for topic, _ in topic_counts.most_common(top_n)]
 
     def identify_trending_videos(self, top_n: int = 10) -> pd.DataFrame:
@@ -101,17 +196,17 @@ class YouTubeAnalyzer:
         """
         logger.info("Identifying trending videos")
 
-        # Calculate engagement score
-        self.df["engagement_score"] = (
-            self.df["view_count"] * 0.5
-            + self.df["like_count"] * 2.0
-            + self.df["comment_count"] * 3.0
-        )
+        # Calculate engagement score on the raw arrays (no per-op index alignment)
+        views = self.df["view_count"].to_numpy()
+        likes = self.df["like_count"].to_numpy()
+        comments = self.df["comment_count"].to_numpy()
+        scores = views * 0.5 + likes * 2.0 + comments * 3.0
+        self.df["engagement_score"] = scores
 
-        # Filter by engagement threshold
-        trending = self.df[
-            self.df["comment_count"] >= MIN_ENGAGEMENT_THRESHOLD
-        ].nlargest(top_n, "engagement_score")
+        # Filter by engagement threshold, then partially select the top N
+        filtered_idx = np.flatnonzero(comments >= MIN_ENGAGEMENT_THRESHOLD)
+        top = filtered_idx[top_n_positions(scores[filtered_idx], top_n)]
+        trending = self.df.iloc[top]
 
         self.insights["trending_videos"] = trending[
             ["title", "channel_title", "view_count", "engagement_score"]
@@ -128,15 +223,20 @@ class YouTubeAnalyzer:
         """
         logger.info("Analyzing engagement metrics")
 
+        # Per-video rate in one pass; videos with no views count as 0 rather than inf
+        views = self.df["view_count"].to_numpy(dtype=np.float64)
+        likes = self.df["like_count"].to_numpy(dtype=np.float64)
+        comments = self.df["comment_count"].to_numpy(dtype=np.float64)
+        interactions = likes + comments
+        rates = np.divide(interactions, views, out=np.zeros_like(views), where=views > 0)
+
         engagement_stats = {
             "avg_views": self.df["view_count"].mean(),
             "median_views": self.df["view_count"].median(),
             "avg_likes": self.df["like_count"].mean(),
             "avg_comments": self.df["comment_count"].mean(),
-            "engagement_rate": (
-                (self.df["like_count"] + self.df["comment_count"])
-                / self.df["view_count"]
-            ).mean(),
+            "engagement_rate": rates.mean() if rates.size else np.nan,
+            "total_comments": int(comments.sum()),
         }
 
         self.insights["engagement_stats"] = engagement_stats
@@ -151,9 +251,12 @@ class YouTubeAnalyzer:
         """
         logger.info("Analyzing sentiment distribution")
 
-        positive_count = (self.df["compound_sentiment"] > SENTIMENT_THRESHOLD_POSITIVE).sum()
-        negative_count = (self.df["compound_sentiment"] < SENTIMENT_THRESHOLD_NEGATIVE).sum()
-        neutral_count = len(self.df) - positive_count - negative_count
+        # Bucket every score in one pass: 0 = negative, 1 = neutral, 2 = positive.
+        # The upper edge is nudged so a score equal to the positive threshold stays neutral.
+        compound = self.df["compound_sentiment"].to_numpy(dtype=float)
+        bins = [SENTIMENT_THRESHOLD_NEGATIVE, np.nextafter(SENTIMENT_THRESHOLD_POSITIVE, np.inf)]
+        labels = np.where(np.isnan(compound), 1, np.digitize(compound, bins))
+        negative_count, neutral_count, positive_count = np.bincount(labels, minlength=3)
 
         sentiment_dist = {
             "positive": int(positive_count),
@@ -174,8 +277,12 @@ class YouTubeAnalyzer:
         """
         logger.info("Extracting industry themes")
 
-        all_titles = " ".join(self.df["title"].fillna(""))
-        themes = self.extract_key_topics(all_titles, top_n=15)
+        if _get_nlp() is None:
+            # Degraded mode: skip building the title list when spaCy isn't available
+            self.insights["industry_themes"] = {"top_themes": []}
+            return {"top_themes": []}
+
+        themes = self.extract_key_topics(self._titles, top_n=15)
 
         self.insights["industry_themes"] = {"top_themes": themes}
         return {"top_themes": themes}
@@ -193,25 +300,14 @@ class YouTubeAnalyzer:
         logger.info("Analyzing top channels")
 
         channel_stats = (
-            self.df.groupby("channel_title")
+            self.df.groupby("channel_title", observed=True, sort=False)
             .agg(
-                {
-                    "video_id": "count",
-                    "view_count": "sum",
-                    "like_count": "sum",
-                    "comment_count": "sum",
-                }
+                video_count=("video_id", "count"),
+                total_views=("view_count", "sum"),
+                total_likes=("like_count", "sum"),
+                total_comments=("comment_count", "sum"),
             )
-            .rename(
-                columns={
-                    "video_id": "video_count",
-                    "view_count": "total_views",
-                    "like_count": "total_likes",
-                    "comment_count": "total_comments",
-                }
-            )
-            .sort_values("total_views", ascending=False)
-            .head(top_n)
+            .nlargest(top_n, "total_views")
         )
 
         self.insights["top_channels"] = channel_stats.to_dict("index")
@@ -226,6 +322,7 @@ class YouTubeAnalyzer:
         """
         logger.info("Running full analysis pipeline")
 
+        self.insights["video_count"] = len(self.df)
         self.analyze_sentiment()
         self.identify_trending_videos()
         self.analyze_engagement()
@@ -237,9 +334,22 @@ class YouTubeAnalyzer:
         return self.insights
 
 
+def load_video_data() -> pd.DataFrame:
+    """
+    Load the collected video table.
+
+    Returns:
+        DataFrame from the Parquet export, or the legacy CSV export if no
+        Parquet file has been written yet
+    """
+    if PARQUET_EXPORT_PATH.exists():
+        return pd.read_parquet(PARQUET_EXPORT_PATH)
+    return pd.read_csv(CSV_EXPORT_PATH)
+
+
 def main():
     """Example usage."""
-    df = pd.read_csv(CSV_EXPORT_PATH)
+    df = load_video_data()
     analyzer = YouTubeAnalyzer(df)
     insights = analyzer.run_full_analysis()
 
@@ -250,4 +360,5 @@ def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     main()
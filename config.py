@@ -17,16 +17,21 @@ YOUTUBE_API_QUOTA_LIMIT = 10000  # Daily quota from Google
 SEARCH_QUERY = "Shivji trending videos"
 MAX_VIDEOS_PER_SEARCH = 50
 DAYS_BACK = 30
+TRANSCRIPT_FETCH_WORKERS = 16  # Concurrent transcript downloads (I/O-bound)
 REGIONS = ["US"]  # Add more region codes as needed
 
 # Analysis Parameters
 SENTIMENT_THRESHOLD_POSITIVE = 0.05
 SENTIMENT_THRESHOLD_NEGATIVE = -0.05
 MIN_ENGAGEMENT_THRESHOLD = 100  # Minimum comments/likes to consider
+NLP_BATCH_SIZE = 64  # Texts per spaCy nlp.pipe batch
+NLP_N_PROCESS = 1  # spaCy worker processes (-1 = all cores, worth it for large batches)
+TOPIC_CACHE_SIZE = 2048  # Texts whose extracted topics are memoized across runs
 
 # Database Configuration
 DB_PATH = PROJECT_ROOT / "data" / "youtube_data.db"
 CSV_EXPORT_PATH = PROJECT_ROOT / "data" / "videos.csv"
+PARQUET_EXPORT_PATH = PROJECT_ROOT / "data" / "videos.parquet"
 TRANSCRIPTS_PATH = PROJECT_ROOT / "data" / "transcripts"
 
 # Gmail Configuration
@@ -5,9 +5,12 @@ Integrates YouTube API v3 and yt-dlp for comprehensive data gathering.
 
 import logging
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_transcript_api._errors import TranscriptsDisabled
 import yt_dlp
@@ -17,12 +20,19 @@ from config import (
     SEARCH_QUERY,
     MAX_VIDEOS_PER_SEARCH,
     DAYS_BACK,
-    CSV_EXPORT_PATH,
+    TRANSCRIPT_FETCH_WORKERS,
+    PARQUET_EXPORT_PATH,
     TRANSCRIPTS_PATH,
 )
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
+# Compact dtypes for the exported video table. view_count stays int64 because
+# the most viewed videos exceed the uint32 range.
+EXPORT_DTYPES = {
+    "like_count": "uint32",
+    "comment_count": "uint32",
+    "channel_title": "category",
+}
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,6 +44,18 @@ class YouTubeDataCollector:
         self.base_url = "https://www.googleapis.com/youtube/v3"
         self.videos_data = []
 
+        # Reuse keep-alive connections to the API and retry transient failures
+        self.session = requests.Session()
+        retries = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+        )
+        self.session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retries),
+        )
+
     def search_videos(
         self,
         query: str,
@@ -69,7 +91,7 @@ class YouTubeDataCollector:
         }
 
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/search", params=params, timeout=10
             )
             response.raise_for_status()
@@ -108,7 +130,7 @@ class YouTubeDataCollector:
             }
 
             try:
-                response = requests.get(
+                response = self.session.get(
                     f"{self.base_url}/videos", params=params, timeout=10
                 )
                 response.raise_for_status()
@@ -165,6 +187,14 @@ class YouTubeDataCollector:
             logger.warning(f"Could not get transcript for {video_id}: {e}")
             return None
 
+    def _fetch_and_save_transcript(self, video_id: str) -> Optional[str]:
+        """Fetch a transcript and save it to TRANSCRIPTS_PATH (runs in a worker thread)."""
+        transcript = self.get_video_transcript(video_id)
+        if transcript:
+            (TRANSCRIPTS_PATH / f"{video_id}.txt").write_bytes(transcript.encode("utf-8"))
+            logger.info(f"Saved transcript for {video_id}")
+        return transcript
+
     def collect_full_data(self, query: str = SEARCH_QUERY) -> pd.DataFrame:
         """
         Complete data collection pipeline.
@@ -181,22 +211,21 @@ class YouTubeDataCollector:
         videos = self.search_videos(query)
         logger.info(f"Collected statistics for {len(videos)} videos")
 
-        # Get transcripts for each video
-        for video in videos:
-            video_id = video["video_id"]
-            transcript = self.get_video_transcript(video_id)
-            video["transcript"] = transcript
+        # Get and save transcripts for each video; the requests are blocking
+        # HTTP calls, so fetch them concurrently
+        video_ids = [video["video_id"] for video in videos]
+        with ThreadPoolExecutor(max_workers=TRANSCRIPT_FETCH_WORKERS) as executor:
+            transcripts = list(executor.map(self._fetch_and_save_transcript, video_ids))
 
-            if transcript:
-                transcript_path = TRANSCRIPTS_PATH / f"{video_id}.txt"
-                with open(transcript_path, "w", encoding="utf-8") as f:
-                    f.write(transcript)
-                logger.info(f"Saved transcript for {video_id}")
+        for video, transcript in zip(videos, transcripts):
+            video["transcript"] = transcript
 
         # Convert to DataFrame
         df = pd.DataFrame(videos)
-        df.to_csv(CSV_EXPORT_PATH, index=False)
-        logger.info(f"Exported {len(df)} videos to {CSV_EXPORT_PATH}")
+        if not df.empty:
+            df = df.astype(EXPORT_DTYPES)
+        df.to_parquet(PARQUET_EXPORT_PATH, compression="zstd", index=False)
+        logger.info(f"Exported {len(df)} videos to {PARQUET_EXPORT_PATH}")
 
         return df
 
@@ -210,4 +239,5 @@ def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     main()
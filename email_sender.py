@@ -13,8 +13,6 @@ from email.mime.text import MIMEText
 from email import encoders
 from config import GMAIL_SENDER_EMAIL, GMAIL_APP_PASSWORD, GMAIL_RECIPIENT
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -27,6 +25,52 @@ class EmailSender:
         self.smtp_server = "smtp.gmail.com"
         self.smtp_port = 587
 
+    def _build_message(
+        self,
+        recipient_email: str,
+        subject: str,
+        body: str,
+        attachment_path: Path,
+    ) -> MIMEMultipart:
+        """Build the MIME message with the body and base64-encoded attachment."""
+        message = MIMEMultipart()
+        message["From"] = self.sender_email
+        message["To"] = recipient_email
+        message["Subject"] = subject
+
+        # Add body
+        message.attach(MIMEText(body, "plain"))
+
+        # Add attachment
+        if attachment_path.exists():
+            with open(attachment_path, "rb") as attachment:
+                part = MIMEBase("application", "octet-stream")
+                part.set_payload(attachment.read())
+
+            encoders.encode_base64(part)
+            part.add_header(
+                "Content-Disposition",
+                f"attachment; filename= {attachment_path.name}",
+            )
+            message.attach(part)
+            logger.info(f"Attached file: {attachment_path.name}")
+        else:
+            logger.warning(f"Attachment file not found: {attachment_path}")
+
+        return message
+
+    def _connect(self) -> smtplib.SMTP:
+        """Open an authenticated SMTP connection (usable as a context manager)."""
+        logger.info(f"Connecting to {self.smtp_server}:{self.smtp_port}")
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        try:
+            server.starttls()
+            server.login(self.sender_email, self.app_password)
+        except Exception:
+            server.close()
+            raise
+        return server
+
     def send_report(
         self,
         recipient_email: str,
@@ -49,36 +93,10 @@ class EmailSender:
         logger.info(f"Preparing email to {recipient_email}")
 
         try:
-            # Create message
-            message = MIMEMultipart()
-            message["From"] = self.sender_email
-            message["To"] = recipient_email
-            message["Subject"] = subject
-
-            # Add body
-            message.attach(MIMEText(body, "plain"))
-
-            # Add attachment
-            if attachment_path.exists():
-                with open(attachment_path, "rb") as attachment:
-                    part = MIMEBase("application", "octet-stream")
-                    part.set_payload(attachment.read())
-
-                encoders.encode_base64(part)
-                part.add_header(
-                    "Content-Disposition",
-                    f"attachment; filename= {attachment_path.name}",
-                )
-                message.attach(part)
-                logger.info(f"Attached file: {attachment_path.name}")
-            else:
-                logger.warning(f"Attachment file not found: {attachment_path}")
+            message = self._build_message(recipient_email, subject, body, attachment_path)
 
             # Send email
-            logger.info(f"Connecting to {self.smtp_server}:{self.smtp_port}")
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.sender_email, self.app_password)
+            with self._connect() as server:
                 server.send_message(message)
 
             logger.info(f"Email sent successfully to {recipient_email}")
@@ -101,6 +119,9 @@ class EmailSender:
         """
         Send report to multiple recipients.
 
+        The message and attachment are encoded once and all recipients are
+        sent over a single SMTP session.
+
         Args:
             recipients: List of email addresses
             subject: Email subject
@@ -110,10 +131,29 @@ class EmailSender:
         Returns:
             Dictionary with send status for each recipient
         """
-        results = {}
-        for recipient in recipients:
-            success = self.send_report(recipient, subject, body, attachment_path)
-            results[recipient] = success
+        results = {recipient: False for recipient in recipients}
+        if not recipients:
+            return results
+
+        logger.info(f"Preparing email batch for {len(recipients)} recipients")
+
+        try:
+            message = self._build_message(recipients[0], subject, body, attachment_path)
+
+            with self._connect() as server:
+                for recipient in recipients:
+                    message.replace_header("To", recipient)
+                    try:
+                        server.send_message(message)
+                        results[recipient] = True
+                        logger.info(f"Email sent successfully to {recipient}")
+                    except smtplib.SMTPRecipientsRefused as e:
+                        logger.error(f"Recipient refused {recipient}: {e}")
+
+        except smtplib.SMTPException as e:
+            logger.error(f"SMTP error: {e}")
+        except Exception as e:
+            logger.error(f"Error sending email batch: {e}")
 
         return results
 
@@ -153,4 +193,5 @@ YouTube Automation System
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     main()
@@ -3,10 +3,22 @@ Utility script to help install and verify all dependencies.
 Run this if you encounter any issues with imports or installations.
 """
 
+import os
 import subprocess
 import sys
+from collections import deque
 from pathlib import Path
 
+# Skip pip's PyPI version self-check, .pyc compilation of every installed
+# file, and interactive prompts. Note PIP_COMPILE=0 rather than
+# PIP_NO_COMPILE=1: pip reads "no-" options from the environment inverted.
+PIP_ENV = {
+    **os.environ,
+    "PIP_DISABLE_PIP_VERSION_CHECK": "1",
+    "PIP_COMPILE": "0",
+    "PIP_NO_INPUT": "1",
+}
+
 
 def run_command(cmd, description=""):
     """Run a shell command and report status."""
@@ -15,14 +27,19 @@ def run_command(cmd, description=""):
     print(f"  Command: {' '.join(cmd)}")
     
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode == 0:
+        # stdout is never shown, and only the tail of stderr is kept, so
+        # verbose installs run in constant memory
+        with subprocess.Popen(
+            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, env=PIP_ENV
+        ) as process:
+            stderr_tail = deque(process.stderr, maxlen=20)
+        if process.returncode == 0:
             print(f"  ✓ Success")
             return True
         else:
             print(f"  ✗ Failed")
-            if result.stderr:
-                print(f"  Error: {result.stderr[:200]}")
+            if stderr_tail:
+                print(f"  Error: {''.join(stderr_tail)[-200:]}")
             return False
     except Exception as e:
         print(f"  ✗ Exception: {e}")
@@ -58,7 +75,7 @@ def main():
     
     if not success:
         print("\n⚠ Installation had issues. Trying alternative approach...")
-        print("Installing packages individually...\n")
+        print("Installing packages in a single pip run...\n")
         
         packages = [
             "google-auth-oauthlib",
@@ -67,21 +84,30 @@ def main():
             "yt-dlp",
             "youtube-transcript-api",
             "pandas",
+            "pyarrow",
             "numpy",
             "spacy",
             "vaderSentiment",
-            "plotly",
             "python-pptx",
             "requests",
             "beautifulsoup4",
             "sqlalchemy",
         ]
         
-        for package in packages:
-            run_command(
-                [sys.executable, "-m", "pip", "install", package],
-                f"Installing {package}..."
-            )
+        # One pip session resolves and downloads everything together
+        batch_success = run_command(
+            [sys.executable, "-m", "pip", "install", *packages],
+            "Installing all packages in one batch..."
+        )
+        
+        if not batch_success:
+            # Retry one at a time so a single bad package doesn't block the rest
+            print("\n⚠ Batch install failed. Installing packages individually...")
+            for package in packages:
+                run_command(
+                    [sys.executable, "-m", "pip", "install", package],
+                    f"Installing {package}..."
+                )
     
     print("\nSTEP 3: Download spaCy language model")
     print("-" * 70)
@@ -90,13 +116,6 @@ def main():
         "Downloading spaCy English model..."
     )
     
-    print("\nSTEP 4: Install Plotly image rendering backend (optional but recommended)")
-    print("-" * 70)
-    run_command(
-        [sys.executable, "-m", "pip", "install", "kaleido"],
-        "Installing kaleido for image rendering..."
-    )
-    
     print("\n" + "=" * 70)
     print("INSTALLATION COMPLETE")
     print("=" * 70)
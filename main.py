@@ -3,17 +3,15 @@ Main orchestration module for YouTube automation system.
 Coordinates data collection, analysis, report generation, and email delivery.
 """
 
+import functools
 import logging
 import sys
 from pathlib import Path
 from datetime import datetime
-import pandas as pd
 
-from config import YOUTUBE_API_KEY, GMAIL_RECIPIENT, REPORT_TITLE, CSV_EXPORT_PATH, SEARCH_QUERY
-from data_collector import YouTubeDataCollector
-from analyzer import YouTubeAnalyzer
-from report_generator import ReportGenerator
-from email_sender import EmailSender
+# Pipeline modules (pandas, yt-dlp, python-pptx, ...) are imported where each
+# step needs them, so importing main or running --help stays fast
+from config import YOUTUBE_API_KEY, GMAIL_RECIPIENT, REPORT_TITLE, SEARCH_QUERY
 
 # Setup logging
 logging.basicConfig(
@@ -23,16 +21,47 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _step(title: str):
+    """
+    Wrap a pipeline step with its banner and failure handling.
+
+    The step's exception, if any, is logged once with its traceback and
+    reported as a failed step.
+
+    Args:
+        title: Banner text for the step, e.g. "STEP 1: Collecting YouTube Data"
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs) -> bool:
+            logger.info("\n" + "=" * 60)
+            logger.info(title)
+            logger.info("=" * 60)
+            try:
+                return bool(func(self, *args, **kwargs))
+            except Exception:
+                logger.exception(f"✗ {title} failed")
+                return False
+
+        return wrapper
+
+    return decorator
+
+
 class YouTubeAutomationPipeline:
     """Main pipeline for YouTube data collection, analysis, and reporting."""
 
     def __init__(self):
+        from data_collector import YouTubeDataCollector
+
         self.collector = YouTubeDataCollector(YOUTUBE_API_KEY)
         self.analyzer = None
         self.df = None
         self.insights = None
         self.report_path = None
 
+    @_step("STEP 1: Collecting YouTube Data")
     def step1_collect_data(self, query: str = None) -> bool:
         """
         Step 1: Collect data from YouTube.
@@ -45,18 +74,12 @@ class YouTubeAutomationPipeline:
         """
         if query is None:
             query = SEARCH_QUERY
-        logger.info("=" * 60)
-        logger.info("STEP 1: Collecting YouTube Data")
-        logger.info("=" * 60)
 
-        try:
-            self.df = self.collector.collect_full_data(query)
-            logger.info(f"✓ Successfully collected data for {len(self.df)} videos")
-            return True
-        except Exception as e:
-            logger.error(f"✗ Data collection failed: {e}")
-            return False
+        self.df = self.collector.collect_full_data(query)
+        logger.info(f"✓ Successfully collected data for {len(self.df)} videos")
+        return True
 
+    @_step("STEP 2: Analyzing Data")
     def step2_analyze_data(self) -> bool:
         """
         Step 2: Analyze collected data.
@@ -64,24 +87,19 @@ class YouTubeAutomationPipeline:
         Returns:
             True if successful
         """
-        logger.info("\n" + "=" * 60)
-        logger.info("STEP 2: Analyzing Data")
-        logger.info("=" * 60)
+        if self.df is None or len(self.df) == 0:
+            logger.error("No data available for analysis")
+            return False
 
-        try:
-            if self.df is None or len(self.df) == 0:
-                logger.error("No data available for analysis")
-                return False
+        from analyzer import YouTubeAnalyzer
 
-            self.analyzer = YouTubeAnalyzer(self.df)
-            self.insights = self.analyzer.run_full_analysis()
-            self.df = self.analyzer.df  # Update df with analysis results
-            logger.info("✓ Analysis complete")
-            return True
-        except Exception as e:
-            logger.error(f"✗ Analysis failed: {e}")
-            return False
+        self.analyzer = YouTubeAnalyzer(self.df)
+        self.insights = self.analyzer.run_full_analysis()
+        self.df = self.analyzer.df  # Update df with analysis results
+        logger.info("✓ Analysis complete")
+        return True
 
+    @_step("STEP 3: Generating Report")
     def step3_generate_report(self) -> bool:
         """
         Step 3: Generate presentation report.
@@ -89,25 +107,20 @@ class YouTubeAutomationPipeline:
         Returns:
             True if successful
         """
-        logger.info("\n" + "=" * 60)
-        logger.info("STEP 3: Generating Report")
-        logger.info("=" * 60)
+        if self.insights is None:
+            logger.error("No insights available for report generation")
+            return False
 
-        try:
-            if self.insights is None:
-                logger.error("No insights available for report generation")
-                return False
+        from report_generator import ReportGenerator
 
-            generator = ReportGenerator(self.insights, self.df)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"YouTube_Trends_Report_{timestamp}.pptx"
-            self.report_path = generator.generate_presentation(filename)
-            logger.info(f"✓ Report generated: {self.report_path}")
-            return True
-        except Exception as e:
-            logger.error(f"✗ Report generation failed: {e}")
-            return False
+        generator = ReportGenerator(self.insights, self.df)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"YouTube_Trends_Report_{timestamp}.pptx"
+        self.report_path = generator.generate_presentation(filename)
+        logger.info(f"✓ Report generated: {self.report_path}")
+        return True
 
+    @_step("STEP 4: Sending Report via Email")
     def step4_send_email(self, recipient: str = GMAIL_RECIPIENT, send_email: bool = True) -> bool:
         """
         Step 4: Send report via email.
@@ -119,36 +132,40 @@ class YouTubeAutomationPipeline:
         Returns:
             True if successful or skipped
         """
-        logger.info("\n" + "=" * 60)
-        logger.info("STEP 4: Sending Report via Email")
-        logger.info("=" * 60)
-
         if not send_email:
             logger.info("⊘ Email sending skipped (disabled)")
             return True
 
-        try:
-            if self.report_path is None:
-                logger.error("No report available to send")
-                return False
+        if self.report_path is None:
+            logger.error("No report available to send")
+            return False
 
-            sender = EmailSender()
+        from email_sender import EmailSender
 
-            body = f"""
+        sender = EmailSender()
+        # One timestamp so the body and subject always agree
+        now = datetime.now()
+
+        # Resolve the insight sections once, filling defaults for missing keys
+        stats = {"avg_views": 0, "engagement_rate": 0, **(self.insights.get("engagement_stats") or {})}
+        sentiment = {"positive": 0, **(self.insights.get("sentiment_distribution") or {})}
+        themes = (self.insights.get("industry_themes") or {}).get("top_themes", [])
+
+        body = f"""
 Hello,
 
 Please find attached your YouTube Trends Analysis Report for the AI & Automation niche.
 
 Report Details:
-- Videos Analyzed: {len(self.df)}
-- Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+- Videos Analyzed: {self.insights.get('video_count', 0)}
+- Report Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}
 - Time Period: Last 30 days
 
 Key Findings:
-- Average Views per Video: {self.insights.get('engagement_stats', {}).get('avg_views', 0):,.0f}
-- Engagement Rate: {self.insights.get('engagement_stats', {}).get('engagement_rate', 0):.2%}
-- Positive Sentiment Videos: {self.insights.get('sentiment_distribution', {}).get('positive', 0)}
-- Top Themes: {', '.join(self.insights.get('industry_themes', {}).get('top_themes', [])[:5])}
+- Average Views per Video: {stats['avg_views']:,.0f}
+- Engagement Rate: {stats['engagement_rate']:.2%}
+- Positive Sentiment Videos: {sentiment['positive']}
+- Top Themes: {', '.join(themes[:5])}
 
 This report includes:
 ✓ Executive Summary
@@ -160,24 +177,20 @@ This report includes:
 
 Best regards,
 YouTube Automation System
-            """
-
-            success = sender.send_report(
-                recipient_email=recipient,
-                subject=f"{REPORT_TITLE} - {datetime.now().strftime('%B %d, %Y')}",
-                body=body,
-                attachment_path=self.report_path,
-            )
-
-            if success:
-                logger.info(f"✓ Email sent successfully to {recipient}")
-                return True
-            else:
-                logger.error("✗ Failed to send email")
-                return False
+        """
 
-        except Exception as e:
-            logger.error(f"✗ Email sending failed: {e}")
+        success = sender.send_report(
+            recipient_email=recipient,
+            subject=f"{REPORT_TITLE} - {now.strftime('%B %d, %Y')}",
+            body=body,
+            attachment_path=self.report_path,
+        )
+
+        if success:
+            logger.info(f"✓ Email sent successfully to {recipient}")
+            return True
+        else:
+            logger.error("✗ Failed to send email")
             return False
 
     def run_full_pipeline(self, send_email: bool = True, query: str = None) -> bool:
@@ -205,17 +218,16 @@ YouTube Automation System
             ("Email Delivery", lambda: self.step4_send_email(send_email=send_email)),
         ]
 
+        # results only feeds the summary below; all_ok decides the outcome
         results = {}
+        all_ok = True
         for step_name, step_func in steps:
-            try:
-                success = step_func()
-                results[step_name] = "✓ PASSED" if success else "✗ FAILED"
-                if not success:
-                    logger.warning(f"Pipeline halted at: {step_name}")
-                    break
-            except Exception as e:
-                logger.error(f"Unexpected error in {step_name}: {e}")
-                results[step_name] = "✗ ERROR"
+            # Each step logs and reports its own failure (see _step)
+            success = step_func()
+            results[step_name] = "✓ PASSED" if success else "✗ FAILED"
+            if not success:
+                all_ok = False
+                logger.warning(f"Pipeline halted at: {step_name}")
                 break
 
         # Print summary
@@ -226,7 +238,7 @@ YouTube Automation System
             logger.info(f"{step}: {result}")
         logger.info("=" * 80)
 
-        return all("✓" in r for r in results.values())
+        return all_ok
 
 
 def main():
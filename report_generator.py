@@ -1,23 +1,24 @@
 """
 Report generation module for creating professional presentations.
-Uses Plotly for visualizations and python-pptx for slide deck creation.
+Uses python-pptx for the slide deck and its native (vector) charts.
 """
 
 import logging
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
 from pptx import Presentation
+from pptx.chart.chart import Chart
+from pptx.chart.data import CategoryChartData
 from pptx.util import Inches, Pt
+from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
+from analyzer import top_n_positions
 from config import REPORT_OUTPUT_PATH, REPORT_TITLE
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -27,11 +28,49 @@ class ReportGenerator:
     def __init__(self, insights: Dict, df: pd.DataFrame):
         self.insights = insights
         self.df = df
+        self._generated_at = datetime.now()  # Shared by every slide that shows a date
         self.prs = Presentation()
         self.prs.slide_width = Inches(10)
         self.prs.slide_height = Inches(7.5)
-        self.charts_dir = REPORT_OUTPUT_PATH / "charts"
-        self.charts_dir.mkdir(parents=True, exist_ok=True)
+
+    def _add_heading(
+        self, slide, text: str, size: int = 40, color: Optional[RGBColor] = None
+    ):
+        """Add the standard bold heading textbox at the top of a slide."""
+        title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(0.6))
+        p = title_box.text_frame.paragraphs[0]
+        p.text = text
+        p.font.size = Pt(size)
+        p.font.bold = True
+        if color is not None:
+            p.font.color.rgb = color
+        return title_box
+
+    def _add_body(
+        self,
+        slide,
+        text: str,
+        rect: Tuple[float, float, float, float],
+        size: int,
+        line_spacing: Optional[float] = None,
+    ):
+        """
+        Add a word-wrapped body textbox; rect is (left, top, width, height) in inches.
+
+        Each line of text becomes its own paragraph (rather than line breaks
+        inside one paragraph), so size and line spacing apply to every line.
+        """
+        left, top, width, height = rect
+        text_box = slide.shapes.add_textbox(Inches(left), Inches(top), Inches(width), Inches(height))
+        text_frame = text_box.text_frame
+        text_frame.word_wrap = True
+        for i, line in enumerate(text.splitlines() or [""]):
+            p = text_frame.paragraphs[0] if i == 0 else text_frame.add_paragraph()
+            p.text = line
+            p.font.size = Pt(size)
+            if line_spacing is not None:
+                p.line_spacing = line_spacing
+        return text_box
 
     def create_title_slide(self):
         """Create title slide."""
@@ -62,7 +101,7 @@ class ReportGenerator:
         )
         subtitle_frame = subtitle_box.text_frame
         p = subtitle_frame.paragraphs[0]
-        p.text = f"Generated on {datetime.now().strftime('%B %d, %Y')}"
+        p.text = f"Generated on {self._generated_at.strftime('%B %d, %Y')}"
         p.font.size = Pt(24)
         p.font.color.rgb = RGBColor(189, 195, 199)
         p.alignment = PP_ALIGN.CENTER
@@ -72,109 +111,101 @@ class ReportGenerator:
         logger.info("Creating executive summary slide")
 
         slide = self.prs.slides.add_slide(self.prs.slide_layouts[5])  # Blank layout
-        title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(0.6))
-        title_frame = title_box.text_frame
-        p = title_frame.paragraphs[0]
-        p.text = "Executive Summary"
-        p.font.size = Pt(44)
-        p.font.bold = True
-        p.font.color.rgb = RGBColor(44, 62, 80)
-
-        # Summary statistics
-        stats = self.insights.get("engagement_stats", {})
-        sentiment = self.insights.get("sentiment_distribution", {})
+        self._add_heading(slide, "Executive Summary", size=44, color=RGBColor(44, 62, 80))
+
+        # Summary statistics, with defaults filled once for any missing keys
+        stats = {
+            "avg_views": 0,
+            "engagement_rate": 0,
+            "total_comments": 0,
+            **(self.insights.get("engagement_stats") or {}),
+        }
+        sentiment = {
+            "positive": 0,
+            "negative": 0,
+            "neutral": 0,
+            "avg_sentiment": 0,
+            **(self.insights.get("sentiment_distribution") or {}),
+        }
 
         summary_text = f"""
-Videos Analyzed: {len(self.df)}
+Videos Analyzed: {self.insights.get('video_count', 0)}
 
 Engagement Metrics:
-• Average Views per Video: {stats.get('avg_views', 0):,.0f}
-• Average Engagement Rate: {stats.get('engagement_rate', 0):.2%}
-• Total Comments: {self.df['comment_count'].sum():,}
+• Average Views per Video: {stats['avg_views']:,.0f}
+• Average Engagement Rate: {stats['engagement_rate']:.2%}
+• Total Comments: {stats['total_comments']:,}
 
 Sentiment Analysis:
-• Positive Sentiment: {sentiment.get('positive', 0)} videos
-• Negative Sentiment: {sentiment.get('negative', 0)} videos
-• Neutral Sentiment: {sentiment.get('neutral', 0)} videos
-• Average Sentiment Score: {sentiment.get('avg_sentiment', 0):.2f}
+• Positive Sentiment: {sentiment['positive']} videos
+• Negative Sentiment: {sentiment['negative']} videos
+• Neutral Sentiment: {sentiment['neutral']} videos
+• Average Sentiment Score: {sentiment['avg_sentiment']:.2f}
         """
 
-        text_box = slide.shapes.add_textbox(Inches(0.5), Inches(1.2), Inches(9), Inches(5.5))
-        text_frame = text_box.text_frame
-        text_frame.word_wrap = True
-        p = text_frame.paragraphs[0]
-        p.text = summary_text.strip()
-        p.font.size = Pt(16)
-        p.line_spacing = 1.5
+        self._add_body(slide, summary_text.strip(), (0.5, 1.2, 9, 5.5), size=16, line_spacing=1.5)
 
-    def create_engagement_chart(self):
-        """Create engagement metrics chart."""
+    def create_engagement_chart(self) -> Optional[Chart]:
+        """Create engagement metrics chart slide."""
         logger.info("Creating engagement chart")
 
+        if len(self.df) == 0:
+            logger.warning("Skipping engagement chart: no videos to plot")
+            return None
+
         try:
-            # Top videos by engagement
-            top_videos = self.df.nlargest(10, "engagement_score")[
-                ["title", "engagement_score", "view_count"]
-            ].copy()
-
-            fig = px.bar(
-                top_videos,
-                x="engagement_score",
-                y="title",
-                orientation="h",
-                title="Top 10 Videos by Engagement Score",
-                labels={"engagement_score": "Engagement Score", "title": "Video Title"},
-            )
-            fig.update_layout(height=600, showlegend=False, yaxis_tickfont=dict(size=10))
+            # Top videos by engagement (partial selection, no full sort)
+            scores = self.df["engagement_score"].to_numpy(dtype=float)
+            top_videos = self.df.iloc[top_n_positions(scores, 10)]
 
-            chart_path = self.charts_dir / "engagement_chart.png"
-            try:
-                fig.write_image(chart_path, width=1200, height=600)
-                logger.info(f"Saved chart: {chart_path}")
-            except Exception as e:
-                logger.warning(f"Could not save chart image: {e}. Continuing without image.")
-                return None
+            # Bar charts plot categories bottom-up, so reverse to put the top video first
+            chart_data = CategoryChartData()
+            chart_data.categories = top_videos["title"].tolist()[::-1]
+            chart_data.add_series("Engagement Score", top_videos["engagement_score"].tolist()[::-1])
 
-            return chart_path
+            chart = self.add_chart_slide(
+                "Engagement Analysis", XL_CHART_TYPE.BAR_CLUSTERED, chart_data
+            )
+            chart.has_title = True
+            chart.chart_title.text_frame.text = "Top 10 Videos by Engagement Score"
+            chart.has_legend = False
+            chart.category_axis.tick_labels.font.size = Pt(10)
+            return chart
         except Exception as e:
             logger.warning(f"Error creating engagement chart: {e}")
             return None
 
-    def create_sentiment_chart(self):
-        """Create sentiment distribution chart."""
+    def create_sentiment_chart(self) -> Optional[Chart]:
+        """Create sentiment distribution chart slide."""
         logger.info("Creating sentiment chart")
 
         try:
             sentiment = self.insights.get("sentiment_distribution", {})
-            data = {
-                "Sentiment": ["Positive", "Negative", "Neutral"],
-                "Count": [
+            chart_data = CategoryChartData()
+            chart_data.categories = ["Positive", "Negative", "Neutral"]
+            chart_data.add_series(
+                "Count",
+                [
                     sentiment.get("positive", 0),
                     sentiment.get("negative", 0),
                     sentiment.get("neutral", 0),
                 ],
-            }
-
-            fig = go.Figure(
-                data=[
-                    go.Pie(
-                        labels=data["Sentiment"],
-                        values=data["Count"],
-                        marker=dict(colors=["#27ae60", "#e74c3c", "#95a5a6"]),
-                    )
-                ]
             )
-            fig.update_layout(title="Sentiment Distribution", height=500)
-
-            chart_path = self.charts_dir / "sentiment_chart.png"
-            try:
-                fig.write_image(chart_path, width=800, height=600)
-                logger.info(f"Saved chart: {chart_path}")
-            except Exception as e:
-                logger.warning(f"Could not save sentiment chart image: {e}. Continuing without image.")
-                return None
 
-            return chart_path
+            chart = self.add_chart_slide("Sentiment Distribution", XL_CHART_TYPE.PIE, chart_data)
+            chart.has_legend = True
+            chart.legend.position = XL_LEGEND_POSITION.RIGHT
+            chart.legend.include_in_layout = False
+            plot = chart.plots[0]
+            plot.has_data_labels = True
+            plot.data_labels.show_value = False  # percentage only, not the raw count
+            plot.data_labels.show_percentage = True
+            plot.data_labels.number_format = "0%"
+            plot.data_labels.number_format_is_linked = False
+            for point, color in zip(plot.series[0].points, ["27ae60", "e74c3c", "95a5a6"]):
+                point.format.fill.solid()
+                point.format.fill.fore_color.rgb = RGBColor.from_string(color)
+            return chart
         except Exception as e:
             logger.warning(f"Error creating sentiment chart: {e}")
             return None
@@ -186,44 +217,28 @@ Sentiment Analysis:
         themes = self.insights.get("industry_themes", {}).get("top_themes", [])
 
         slide = self.prs.slides.add_slide(self.prs.slide_layouts[5])
-        title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(0.6))
-        title_frame = title_box.text_frame
-        p = title_frame.paragraphs[0]
-        p.text = "Key Industry Themes"
-        p.font.size = Pt(44)
-        p.font.bold = True
+        self._add_heading(slide, "Key Industry Themes", size=44)
 
-        themes_text = "\n".join([f"• {theme}" for theme in themes[:12]])
+        themes_text = "\n".join(f"• {theme}" for theme in islice(themes, 12))
 
-        text_box = slide.shapes.add_textbox(Inches(1), Inches(1.5), Inches(8), Inches(5.5))
-        text_frame = text_box.text_frame
-        text_frame.word_wrap = True
-        p = text_frame.paragraphs[0]
-        p.text = themes_text
-        p.font.size = Pt(18)
-        p.line_spacing = 1.8
-
-    def add_chart_slide(self, chart_title: str, chart_path: Path):
-        """Add a slide with a chart image."""
-        if chart_path is None:
-            logger.warning(f"Skipping chart slide: {chart_title} (no image available)")
-            return
-            
+        self._add_body(slide, themes_text, (1, 1.5, 8, 5.5), size=18, line_spacing=1.8)
+
+    def add_chart_slide(
+        self, chart_title: str, chart_type: XL_CHART_TYPE, chart_data: CategoryChartData
+    ) -> Chart:
+        """Add a slide with a native python-pptx chart and return the chart."""
         logger.info(f"Adding chart slide: {chart_title}")
 
         slide = self.prs.slides.add_slide(self.prs.slide_layouts[5])
 
         # Title
-        title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(0.6))
-        title_frame = title_box.text_frame
-        p = title_frame.paragraphs[0]
-        p.text = chart_title
-        p.font.size = Pt(40)
-        p.font.bold = True
+        self._add_heading(slide, chart_title)
 
-        # Add chart image
-        if chart_path.exists():
-            slide.shapes.add_picture(str(chart_path), Inches(0.5), Inches(1.2), width=Inches(9))
+        # Add chart
+        graphic_frame = slide.shapes.add_chart(
+            chart_type, Inches(0.5), Inches(1.2), Inches(9), Inches(6), chart_data
+        )
+        return graphic_frame.chart
 
     def create_top_channels_slide(self):
         """Create top channels slide."""
@@ -232,36 +247,22 @@ Sentiment Analysis:
         channels = self.insights.get("top_channels", {})
 
         slide = self.prs.slides.add_slide(self.prs.slide_layouts[5])
-        title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(0.6))
-        title_frame = title_box.text_frame
-        p = title_frame.paragraphs[0]
-        p.text = "Top Performing Channels"
-        p.font.size = Pt(40)
-        p.font.bold = True
+        self._add_heading(slide, "Top Performing Channels")
 
-        channels_text = ""
-        for i, (channel, stats) in enumerate(list(channels.items())[:8], 1):
-            channels_text += f"{i}. {channel}\n"
-            channels_text += f"   Videos: {stats.get('video_count', 0)}, Total Views: {stats.get('total_views', 0):,}\n\n"
+        channels_text = "\n\n".join(
+            f"{i}. {channel}\n"
+            f"   Videos: {stats.get('video_count', 0)}, Total Views: {stats.get('total_views', 0):,}"
+            for i, (channel, stats) in enumerate(islice(channels.items(), 8), 1)
+        )
 
-        text_box = slide.shapes.add_textbox(Inches(0.7), Inches(1.2), Inches(8.6), Inches(5.8))
-        text_frame = text_box.text_frame
-        text_frame.word_wrap = True
-        p = text_frame.paragraphs[0]
-        p.text = channels_text.strip()
-        p.font.size = Pt(14)
+        self._add_body(slide, channels_text, (0.7, 1.2, 8.6, 5.8), size=14)
 
     def create_conclusion_slide(self):
         """Create conclusion slide."""
         logger.info("Creating conclusion slide")
 
         slide = self.prs.slides.add_slide(self.prs.slide_layouts[5])
-        title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(0.6))
-        title_frame = title_box.text_frame
-        p = title_frame.paragraphs[0]
-        p.text = "Key Takeaways"
-        p.font.size = Pt(40)
-        p.font.bold = True
+        self._add_heading(slide, "Key Takeaways")
 
         conclusion = """
 • The AI and automation niche shows strong engagement and growth
@@ -278,13 +279,7 @@ Recommendations:
 ✓ Optimize titles and descriptions for discoverability
         """
 
-        text_box = slide.shapes.add_textbox(Inches(0.7), Inches(1.2), Inches(8.6), Inches(5.8))
-        text_frame = text_box.text_frame
-        text_frame.word_wrap = True
-        p = text_frame.paragraphs[0]
-        p.text = conclusion.strip()
-        p.font.size = Pt(14)
-        p.line_spacing = 1.6
+        self._add_body(slide, conclusion.strip(), (0.7, 1.2, 8.6, 5.8), size=14, line_spacing=1.6)
 
     def generate_presentation(self, output_filename: str = "YouTube_Trends_Report.pptx") -> Path:
         """
@@ -295,17 +290,20 @@ Recommendations:
 
         Returns:
             Path to generated presentation
+
+        Raises:
+            ValueError: If there is no video data to report on
         """
+        if self.df is None or len(self.df) == 0:
+            raise ValueError("No data to report")
+
         logger.info("Generating presentation")
 
         self.create_title_slide()
         self.create_executive_summary_slide()
 
-        engagement_chart = self.create_engagement_chart()
-        self.add_chart_slide("Engagement Analysis", engagement_chart)
-
-        sentiment_chart = self.create_sentiment_chart()
-        self.add_chart_slide("Sentiment Distribution", sentiment_chart)
+        self.create_engagement_chart()
+        self.create_sentiment_chart()
 
         self.create_themes_slide()
         self.create_top_channels_slide()
@@ -320,9 +318,9 @@ Recommendations:
 
 def main():
     """Example usage."""
-    from analyzer import YouTubeAnalyzer
+    from analyzer import YouTubeAnalyzer, load_video_data
 
-    df = pd.read_csv("data/videos.csv")
+    df = load_video_data()
     analyzer = YouTubeAnalyzer(df)
     insights = analyzer.run_full_analysis()
 
@@ -332,4 +330,5 @@ def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     main()
@@ -5,8 +5,14 @@ Run this script to verify and set up your environment.
 
 import sys
 import os
-from pathlib import Path
-import subprocess
+import hashlib
+import io
+import json
+import sysconfig
+import threading
+import time
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 
 # Color codes for terminal output
 GREEN = "\033[92m"
@@ -15,17 +21,89 @@ YELLOW = "\033[93m"
 BLUE = "\033[94m"
 END = "\033[0m"
 
+# Help shown when configuration is incomplete, formatted once at import
+_NEXT_STEPS = """
+1. {YELLOW}Set up API Credentials:{END}
+   
+   YouTube API:
+   - Go to https://console.cloud.google.com/
+   - Create a new project
+   - Enable YouTube Data API v3
+   - Create API key
+   - Run: export YOUTUBE_API_KEY="your_key_here"
+   
+   Gmail (optional, for email delivery):
+   - Enable 2-Factor Authentication on Google Account
+   - Go to https://myaccount.google.com/apppasswords
+   - Generate app password
+   - Run commands:
+     export GMAIL_SENDER_EMAIL="your-email@gmail.com"
+     export GMAIL_APP_PASSWORD="your_app_password"
+     export GMAIL_RECIPIENT="recipient@example.com"
+
+2. {YELLOW}Verify Installation:{END}
+   python setup.py  # Re-run this script
+
+3. {YELLOW}Run Pipeline:{END}
+   python main.py --skip-email  # Test without email
+   python main.py                # Full pipeline with email
+
+4. {YELLOW}View Results:{END}
+   - Data: data/videos.parquet
+   - Transcripts: data/transcripts/
+   - Reports: reports/YouTube_Trends_Report_*.pptx
+   - Logs: logs/youtube_automation.log
+
+5. {YELLOW}Documentation:{END}
+   See README.md for detailed usage and configuration
+    """.format(YELLOW=YELLOW, END=END) + "\n"
+
+# Passed dependency/spaCy checks are remembered here for a day, keyed by the
+# interpreter, requirements.txt and site-packages, so re-runs skip them
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_PATH = os.path.join(BASE_DIR, ".setup_cache.json")
+CACHE_TTL_SECONDS = 24 * 60 * 60
+REQUIREMENTS_PATH = os.path.join(BASE_DIR, "requirements.txt")
+
+# Written into site-packages once every dependency is found, holding a hash of
+# requirements.txt and the install fingerprint (see _install_fingerprint);
+# while both match, the dependency check is skipped
+SITE_PACKAGES = sysconfig.get_paths()["purelib"]
+SENTINEL_PATH = os.path.join(SITE_PACKAGES, ".youtube_automation_ok")
+
+# Required packages: import name (as reported) -> distribution name on PyPI
+REQUIRED_PACKAGES = {
+    "google.auth": "google-auth",
+    "youtube_transcript_api": "youtube-transcript-api",
+    "pandas": "pandas",
+    "spacy": "spacy",
+    "vaderSentiment": "vaderSentiment",
+    "pptx": "python-pptx",
+    "requests": "requests",
+    "pyarrow": "pyarrow",
+}
+
+# Environment variables check_config expects (see config.py)
+REQUIRED_ENV_VARS = ["YOUTUBE_API_KEY", "GMAIL_SENDER_EMAIL", "GMAIL_APP_PASSWORD"]
+
+
+# Colored prefix for each print_status level
+_STATUS = {
+    "success": f"{GREEN}✓{END}",
+    "error": f"{RED}✗{END}",
+    "warning": f"{YELLOW}⚠{END}",
+    "info": f"{BLUE}ℹ{END}",
+}
+
+
+def _status_line(message, status="info"):
+    """Format a colored status line."""
+    return f"{_STATUS[status]} {message}\n"
+
 
 def print_status(message, status="info"):
     """Print colored status message."""
-    if status == "success":
-        print(f"{GREEN}✓{END} {message}")
-    elif status == "error":
-        print(f"{RED}✗{END} {message}")
-    elif status == "warning":
-        print(f"{YELLOW}⚠{END} {message}")
-    elif status == "info":
-        print(f"{BLUE}ℹ{END} {message}")
+    sys.stdout.write(_status_line(message, status))
 
 
 def check_python():
@@ -40,45 +118,155 @@ def check_python():
         return False
 
 
-def check_dependencies():
+def _is_installed(package):
+    """
+    Check whether a package can be imported, without importing it.
+
+    find_spec only walks the import finders, so the package's top-level code
+    never runs. A dotted name imports only its parent package.
+    """
+    try:
+        return importlib.util.find_spec(package) is not None
+    except ImportError:  # parent package of a dotted name is missing
+        return False
+
+
+def _normalize_dist_name(name):
+    """Normalize a distribution name for comparison (PEP 503)."""
+    return name.lower().replace("_", "-").replace(".", "-")
+
+
+def _installed_distributions():
+    """Return the normalized names of every installed distribution, from one metadata scan."""
+    # Imported here: importlib.metadata pulls in pathlib, zipfile and email,
+    # which the cached and sentinel paths never need
+    import importlib.metadata
+
+    return {
+        _normalize_dist_name(dist.metadata["Name"])
+        for dist in importlib.metadata.distributions()
+        if dist.metadata["Name"]
+    }
+
+
+def _install_fingerprint():
+    """
+    Describe what is installed and what this script checks for, as one string.
+
+    Installing or removing a package changes the mtime of the directory it
+    lives in, so every site-packages directory is covered: purelib, platlib
+    (separate on distro Pythons, and where compiled packages such as pandas
+    go) and the user site. A digest of REQUIRED_PACKAGES is included so that
+    adding a required package invalidates earlier results.
+    """
+    import site
+
+    paths = sysconfig.get_paths()
+    site_dirs = dict.fromkeys([paths["purelib"], paths["platlib"], site.getusersitepackages()])
+    mtimes = [str(os.path.getmtime(path)) for path in site_dirs if os.path.isdir(path)]
+    packages_hash = hashlib.blake2b(
+        json.dumps(REQUIRED_PACKAGES, sort_keys=True).encode(), digest_size=8
+    ).hexdigest()
+    return "|".join([packages_hash, *mtimes])
+
+
+def _dependency_state():
+    """
+    Describe requirements.txt and the installed packages as one string.
+
+    Returns:
+        Digest of requirements.txt plus the install fingerprint, or None if
+        requirements.txt can't be read
+    """
+    try:
+        with open(REQUIREMENTS_PATH, "rb") as f:
+            req_hash = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+        return f"{req_hash}|{_install_fingerprint()}"
+    except OSError:
+        return None
+
+
+def _read_sentinel():
+    """Return the dependency state recorded in the sentinel file, if any."""
+    try:
+        with open(SENTINEL_PATH) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _write_sentinel():
+    """Record that the current dependency state is satisfied (best effort; site-packages may be read-only)."""
+    try:
+        # Creating the file changes the site-packages mtime, so create it
+        # before reading the state; rewriting it afterwards leaves the mtime alone
+        if not os.path.exists(SENTINEL_PATH):
+            open(SENTINEL_PATH, "w").close()
+        state = _dependency_state()
+        if state is not None:
+            with open(SENTINEL_PATH, "w") as f:
+                f.write(state)
+    except OSError:
+        pass
+
+
+def check_dependencies(force=False):
     """Check if dependencies are installed."""
     print(f"\n{BLUE}=== Checking Dependencies ==={END}")
     
-    required = [
-        "google.auth",
-        "youtube_transcript_api",
-        "pandas",
-        "spacy",
-        "vaderSentiment",
-        "plotly",
-        "pptx",
-        "requests",
+    if not force:
+        state = _dependency_state()
+        if state is not None and _read_sentinel() == state:
+            print_status("All packages in requirements.txt previously verified", "success")
+            return True, []
+    
+    # One pass over installed metadata answers every package, instead of a
+    # finder lookup per package
+    installed = _installed_distributions()
+    results = [
+        (package, _normalize_dist_name(dist) in installed)
+        for package, dist in REQUIRED_PACKAGES.items()
     ]
     
-    missing = []
-    for package in required:
-        try:
-            __import__(package)
-            print_status(f"{package}", "success")
-        except ImportError:
-            print_status(f"{package}", "error")
-            missing.append(package)
+    missing = [package for package, ok in results if not ok]
+    # One write for the whole list instead of a print per package
+    lines = [_status_line(package, "success" if ok else "error") for package, ok in results]
+    sys.stdout.write("".join(lines))
     
+    if not missing:
+        _write_sentinel()
     return len(missing) == 0, missing
 
 
+def _run_pip(args):
+    """
+    Run pip with the given arguments and return its exit code.
+
+    pip runs inside this interpreter, which saves starting a second Python
+    and re-importing pip. The subprocess is only a fallback for pip versions
+    whose internal entry point has moved.
+    """
+    try:
+        from pip._internal.cli.main import main as pip_main
+    except ImportError:
+        import subprocess
+
+        return subprocess.call([sys.executable, "-m", "pip", *args])
+    try:
+        return pip_main(args)
+    except SystemExit as exc:  # pip exits rather than returns on usage errors
+        return exc.code if isinstance(exc.code, int) else 1
+
+
 def install_dependencies():
     """Install dependencies from requirements.txt."""
     print(f"\n{BLUE}=== Installing Dependencies ==={END}")
     
-    try:
-        subprocess.check_call(
-            [sys.executable, "-m", "pip", "install", "-r", "requirements.txt"],
-            cwd=Path(__file__).parent
-        )
+    if _run_pip(["install", "-r", REQUIREMENTS_PATH]) == 0:
+        _write_sentinel()
         print_status("Dependencies installed successfully", "success")
         return True
-    except subprocess.CalledProcessError:
+    else:
         print_status("Failed to install dependencies", "error")
         return False
 
@@ -87,135 +275,216 @@ def check_spacy_model():
     """Check if spaCy model is installed."""
     print(f"\n{BLUE}=== Checking spaCy Model ==={END}")
     
-    try:
-        import spacy
-        nlp = spacy.load("en_core_web_sm")
+    # The model is installed as a regular package; finding it is enough, without
+    # importing spaCy or loading the pipeline into memory
+    if _is_installed("en_core_web_sm"):
         print_status("spaCy model 'en_core_web_sm' found", "success")
         return True
-    except OSError:
+    else:
         print_status("spaCy model 'en_core_web_sm' not found", "warning")
         print(f"{YELLOW}Run: python -m spacy download en_core_web_sm{END}")
         return False
 
 
+def _cache_key():
+    """Identify this environment: any install or requirements edit changes the key."""
+    requirements_mtime = os.path.getmtime(REQUIREMENTS_PATH) if os.path.exists(REQUIREMENTS_PATH) else 0
+    return f"{sys.executable}|{requirements_mtime}|{_install_fingerprint()}"
+
+
+def load_cached_checks():
+    """Return True if dependencies and the spaCy model passed recently in this environment."""
+    try:
+        with open(CACHE_PATH) as f:
+            entry = json.load(f).get(_cache_key())
+    except (OSError, ValueError):
+        return False
+    return bool(
+        entry
+        and entry.get("deps_ok")
+        and entry.get("spacy_ok")
+        and time.time() - entry.get("ts", 0) < CACHE_TTL_SECONDS
+    )
+
+
+def save_cached_checks(deps_ok, spacy_ok):
+    """Record check results for this environment (best effort)."""
+    entry = {"deps_ok": deps_ok, "spacy_ok": spacy_ok, "ts": time.time()}
+    try:
+        with open(CACHE_PATH, "w") as f:
+            json.dump({_cache_key(): entry}, f)
+    except OSError:
+        pass
+
+
 def check_config():
     """Check if configuration is set up."""
     print(f"\n{BLUE}=== Checking Configuration ==={END}")
     
-    # Check for .env file or environment variables
-    has_api_key = bool(os.getenv("YOUTUBE_API_KEY"))
-    has_gmail_email = bool(os.getenv("GMAIL_SENDER_EMAIL"))
-    has_gmail_pass = bool(os.getenv("GMAIL_APP_PASSWORD"))
-    
-    if has_api_key:
-        print_status("YOUTUBE_API_KEY environment variable found", "success")
-    else:
-        print_status("YOUTUBE_API_KEY not set", "warning")
+    # Check environment variables (set and non-empty)
+    env = os.environ
+    results = [(name, bool(env.get(name))) for name in REQUIRED_ENV_VARS]
     
-    if has_gmail_email:
-        print_status("GMAIL_SENDER_EMAIL environment variable found", "success")
-    else:
-        print_status("GMAIL_SENDER_EMAIL not set", "warning")
-    
-    if has_gmail_pass:
-        print_status("GMAIL_APP_PASSWORD environment variable found", "success")
-    else:
-        print_status("GMAIL_APP_PASSWORD not set", "warning")
+    for name, is_set in results:
+        if is_set:
+            print_status(f"{name} environment variable found", "success")
+        else:
+            print_status(f"{name} not set", "warning")
     
-    return has_api_key and has_gmail_email and has_gmail_pass
+    return all(is_set for _, is_set in results)
+
+
+def _list_subdirs(path):
+    """Return the names of the directories directly inside path (empty if it doesn't exist)."""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries if entry.is_dir()}
+    except OSError:
+        return set()
 
 
 def check_directories():
     """Check if required directories exist."""
     print(f"\n{BLUE}=== Checking Directory Structure ==={END}")
     
-    base_path = Path(__file__).parent
-    dirs_to_create = [
-        base_path / "data",
-        base_path / "data" / "transcripts",
-        base_path / "reports",
-        base_path / "reports" / "charts",
-        base_path / "logs",
-    ]
+    required_dirs = ["data", "data/transcripts", "reports", "logs"]
+    # Only leaves need creating: makedirs on data/transcripts makes data too
+    leaf_dirs = ["data/transcripts", "reports", "logs"]
     
-    for directory in dirs_to_create:
-        if directory.exists():
-            print_status(f"{directory.relative_to(base_path)}", "success")
+    # List each parent once rather than stat'ing every directory
+    listings = {}
+    missing = set()
+    for name in required_dirs:
+        parent, _, child = name.rpartition("/")
+        if parent not in listings:
+            listings[parent] = _list_subdirs(os.path.join(BASE_DIR, parent))
+        if child in listings[parent]:
+            print_status(name, "success")
         else:
-            print_status(f"{directory.relative_to(base_path)} (will be created)", "warning")
-            directory.mkdir(parents=True, exist_ok=True)
+            print_status(f"{name} (will be created)", "warning")
+            missing.add(name)
+    
+    for name in leaf_dirs:
+        if name in missing:
+            os.makedirs(os.path.join(BASE_DIR, name), exist_ok=True)
 
 
 def print_next_steps():
     """Print next steps for user."""
     print(f"\n{BLUE}=== Next Steps ==={END}")
     
-    print("""
-1. {YELLOW}Set up API Credentials:{END}
-   
-   YouTube API:
-   - Go to https://console.cloud.google.com/
-   - Create a new project
-   - Enable YouTube Data API v3
-   - Create API key
-   - Run: export YOUTUBE_API_KEY="your_key_here"
-   
-   Gmail (optional, for email delivery):
-   - Enable 2-Factor Authentication on Google Account
-   - Go to https://myaccount.google.com/apppasswords
-   - Generate app password
-   - Run commands:
-     export GMAIL_SENDER_EMAIL="your-email@gmail.com"
-     export GMAIL_APP_PASSWORD="your_app_password"
-     export GMAIL_RECIPIENT="recipient@example.com"
+    sys.stdout.write(_NEXT_STEPS)
 
-2. {YELLOW}Verify Installation:{END}
-   python setup.py  # Re-run this script
 
-3. {YELLOW}Run Pipeline:{END}
-   python main.py --skip-email  # Test without email
-   python main.py                # Full pipeline with email
+def install_missing_packages(deps_ok, spacy_ok):
+    """
+    Offer to install dependencies or the spaCy model that the checks found missing.
 
-4. {YELLOW}View Results:{END}
-   - Data: data/videos.csv
-   - Transcripts: data/transcripts/
-   - Reports: reports/YouTube_Trends_Report_*.pptx
-   - Logs: logs/youtube_automation.log
-
-5. {YELLOW}Documentation:{END}
-   See README.md for detailed usage and configuration
-    """.format(YELLOW=YELLOW, END=END))
-
-
-def main():
-    """Run setup checks."""
-    print(f"\n{BLUE}{'='*60}")
-    print(f"YouTube Automation System - Setup Verification")
-    print(f"{'='*60}{END}\n")
-    
-    # Run checks
-    python_ok = check_python()
-    deps_ok, missing = check_dependencies()
-    
+    Returns:
+        Tuple of (deps_ok, spacy_ok) after any installs
+    """
     if not deps_ok:
         print_status("Installing missing dependencies...", "warning")
+        # pip exits non-zero if any requirement can't be installed, so a clean
+        # exit already confirms every dependency without probing them again
         if install_dependencies():
-            deps_ok, missing = check_dependencies()
+            deps_ok = True
     
-    spacy_ok = check_spacy_model()
     if not spacy_ok:
         response = input(f"\n{YELLOW}Install spaCy model now? (y/n): {END}").strip().lower()
         if response == 'y':
             try:
-                subprocess.check_call(
-                    [sys.executable, "-m", "spacy", "download", "en_core_web_sm"]
-                )
+                from spacy.cli import download
+
+                download("en_core_web_sm")
+                importlib.invalidate_caches()
                 spacy_ok = check_spacy_model()
             except:
                 print_status("Failed to install spaCy model", "error")
     
-    config_ok = check_config()
-    check_directories()
+    return deps_ok, spacy_ok
+
+
+_thread_output = threading.local()
+
+
+class _PerThreadStdout:
+    """sys.stdout stand-in that sends a worker thread's output to its own buffer."""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, text):
+        buffer = getattr(_thread_output, "buffer", None)
+        return (self._stream if buffer is None else buffer).write(text)
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def _run_buffered(check):
+    """Run a check in the current thread, capturing what it prints."""
+    _thread_output.buffer = io.StringIO()
+    try:
+        return check(), _thread_output.buffer.getvalue()
+    finally:
+        _thread_output.buffer = None
+
+
+def run_checks(checks):
+    """
+    Run independent checks concurrently and return their results in order.
+
+    Each check's output is buffered and printed once all have finished, in
+    the order given, so sections never interleave.
+    """
+    stdout = sys.stdout
+    sys.stdout = _PerThreadStdout(stdout)
+    try:
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            outcomes = list(executor.map(_run_buffered, checks))
+    finally:
+        sys.stdout = stdout
+    
+    for _, output in outcomes:
+        sys.stdout.write(output)
+    return [result for result, _ in outcomes]
+
+
+def main():
+    """Run setup checks."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="YouTube Automation setup verification")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-run every check, ignoring cached results",
+    )
+    args = parser.parse_args()
+
+    print(f"\n{BLUE}{'='*60}")
+    print(f"YouTube Automation System - Setup Verification")
+    print(f"{'='*60}{END}\n")
+    
+    # Run checks
+    python_ok = check_python()
+    
+    if not args.force and load_cached_checks():
+        print_status("Dependencies and spaCy model verified recently (use --force to re-check)", "success")
+        config_ok, _ = run_checks([check_config, check_directories])
+        deps_ok = spacy_ok = True
+    else:
+        (deps_ok, _), spacy_ok, config_ok, _ = run_checks(
+            [
+                lambda: check_dependencies(force=args.force),
+                check_spacy_model,
+                check_config,
+                check_directories,
+            ]
+        )
+        deps_ok, spacy_ok = install_missing_packages(deps_ok, spacy_ok)
+        save_cached_checks(deps_ok, spacy_ok)
     
     # Print summary
     print(f"\n{BLUE}=== Setup Summary ==={END}")